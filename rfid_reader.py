@@ -1,10 +1,210 @@
 import struct
-import re
-from PyQt5.QtCore           import QThread, pyqtSignal, QMutex
+import logging
+import threading
+from time                   import monotonic
+from dataclasses            import dataclass, fields
+from PyQt5.QtCore           import QThread, pyqtSignal
 from serial_io              import *
 
 __author__ = "Y. Osroosh, Ph.D. <yosroosh@gmail.com>"
 
+log = logging.getLogger(__name__)
+
+# C/R & Opcode in the response messages from the UHF reader
+GET_VERSION = b'\x80\x04'
+GET_TEMP = b'\x80\x13'
+GET_OP_REGION = b'\x80\x03'
+SET_OP_REGION = b'\x80\x02'
+GET_OP_PARAMS = b'\x80\x0B'
+SET_OP_PARAMS = b'\x80\x0A'
+GET_EVENT_MASK = b'\x80\x15'
+SET_EVENT_MASK = b'\x80\x14'
+SET_TX_POWER = b'\x80\x05'
+GET_TX_POWER = b'\x80\x06'
+SET_ANT_ENABLES = b'\x80\x0E'
+GET_ANT_ENABLES = b'\x80\x0F'
+SET_OP_STATE = b'\x80\x0C'
+GET_OP_STATE = b'\x80\x0D'
+GET_TAG_REPORT = b'\x80\x09'
+KEEP_ALIVE = b'\x80\x01'
+# Status bytes
+STATUS_SUCCESS = b'\x00\x00'
+STATUS_OP_REGION_INVALID = b'\x00\x05'
+STATUS_INVALID_POWER_LEVEL = b'\x00\x06'
+STATUS_INTERNAL_ERROR = b'\x00\x07'
+# Framing bytes
+FRAMING_BYTES = b'\xf6('
+FRAMING_BYTES_LEN = 2
+# C/R bit of the responses and status of a successful response as ints (cf. the bytes STATUS_SUCCESS), to compare decoded headers with
+_RESPONSE_FLAG_INT = 0x8000
+_STATUS_SUCCESS_INT = 0x0000
+
+# Pre-compiled layouts (big-endian) of the fields in the UHF reader responses
+_RESPONSE_HEADER_STRUCT = struct.Struct('>HH')  # C/R & Opcode and status (follow the length)
+_TEMP_STRUCT = struct.Struct('>H')              # Temperature in 1/100 deg C
+_OP_PARAM_STRUCT = struct.Struct('>HI')         # Operational param code and value
+_EVENT_MASK_STRUCT = struct.Struct('>I')        # 32-bit event mask
+_TX_POWER_STRUCT = struct.Struct('>HHHH')       # TX power (1/100 dBm) of antennas 1-4
+_ANT_ENABLES_STRUCT = struct.Struct('>H')       # Antenna enables bit vector
+_TAG_REPORT_STRUCT = struct.Struct('>HhhIHH')   # Reply reason, RSSI, power, timestamp, antenna, EPC length
+_OP_STATE_STRUCT = struct.Struct('>H')          # Operating state
+
+# Pre-compiled layouts (big-endian) of the UHF reader commands: framing, length, C/R & Opcode (+ words)
+_FRAMING_WORD = 0xF628
+_CMD_HEADER_STRUCT = struct.Struct('>HHH')
+_CMD_WORD_STRUCT = struct.Struct('>HHHH')
+_UINT16_STRUCT = struct.Struct('>H')
+_UINT32_STRUCT = struct.Struct('>I')
+
+# C/R & Opcode of the UHF reader commands and of the responses they expect
+_COMMANDS = {
+    'KEEP_ALIVE': (0x0001, KEEP_ALIVE),
+    'SET_OP_REGION': (0x0002, SET_OP_REGION),
+    'GET_OP_REGION': (0x0003, GET_OP_REGION),
+    'GET_VERSION': (0x0004, GET_VERSION),
+    'SET_TX_POWER': (0x0005, SET_TX_POWER),
+    'GET_TX_POWER': (0x0006, GET_TX_POWER),
+    'GET_TAG_REPORT': (0x0009, GET_TAG_REPORT),
+    'SET_OP_PARAMS': (0x000A, SET_OP_PARAMS),
+    'GET_OP_PARAMS': (0x000B, GET_OP_PARAMS),
+    'SET_OP_STATE': (0x000C, SET_OP_STATE),
+    'GET_OP_STATE': (0x000D, GET_OP_STATE),
+    'SET_ANT_ENABLES': (0x000E, SET_ANT_ENABLES),
+    'GET_ANT_ENABLES': (0x000F, GET_ANT_ENABLES),
+    'GET_TEMP': (0x0013, GET_TEMP),
+    'SET_EVENT_MASK': (0x0014, SET_EVENT_MASK),
+    'GET_EVENT_MASK': (0x0015, GET_EVENT_MASK)
+}
+
+# Names of the bits (LSB first) in the event mask and the antenna enables bit vector
+_EVENT_MASK_BITS = ('tag_seen', 'tag_removed', 'tag_power_change', 'tag_report_timeout', 'gen2_op_completed', 'gen2_op_timeout')
+_ANT_ENABLES_BITS = ('ant1enables', 'ant2enables', 'ant3enables', 'ant4enables')
+# Names of the TX power words (antennas 1-4)
+_TX_POWER_WORDS = ('ant1power', 'ant2power', 'ant3power', 'ant4power')
+
+# Reasons for a tag report
+_REPLY_REASONS = {
+    0x0001: 'New Tag Seen',         # A new tag was added to the observed tag population
+    0x0002: 'Tag Removed',          # A tag has not been seen for the configured tag timeout value
+    0x0003: 'Power Changed',        # The tag’s reported RSSI value has changed significantly since its last report.
+    0x0004: 'GEN2 Op Completed',    # A requested GEN2 operation for this tag has completed
+    0x0005: 'Tag Report Timeout',   # If configured, a tag will be periodically reported upon at a specified interval.
+    0x0006: 'Report Requested'      # The host requested that one or more tags be reported upon.
+}
+
+# Names of the operating states
+_OP_STATE_NAMES = {
+    0x0000: 'Idle',
+    0x0001: 'CW Test',
+    0x0002: 'PRBS Test',
+    0x0003: 'ETSI Burst Test',
+    0x0004: 'Tag Read',
+    0x0005: 'Over Temp',
+    0x0006: 'Reader_Error',
+    0x0007: 'Hard_Reset',
+    0x0008: 'SW_Mismatch',
+    0x0009: 'Bootloader'
+}
+
+
+def _build_cmd_header(length, cr_opcode):
+    """
+        Builds the header of a UHF command
+        
+        "The overall format of a message starts with the following 6 byte header. The first two bytes contain a
+        fixed framing pattern of 0xF628. The next two bytes contain the length of the message, including the 2
+        length bytes but excluding the two framing bytes. The next two bytes contain a 15 bit opcode and a 1
+        bit Command/Response indication."
+    Args:
+        length (int): length of the message
+        cr_opcode (int): C/R + Opcode (15 bit opcode and a 1 bit Command/Response indication)
+    Returns:
+        bytes: header of the command (the whole command if it has no payload)
+    """
+    return _CMD_HEADER_STRUCT.pack(_FRAMING_WORD, length, cr_opcode)
+
+
+def _build_cmd_u16(cr_opcode, word):
+    """
+        Builds a UHF command with a single 16-bit word as payload
+    Args:
+        cr_opcode (int): C/R + Opcode (15 bit opcode and a 1 bit Command/Response indication)
+        word (int): unsigned 16-bit payload
+    Returns:
+        bytes: built message in bytes
+    """
+    return _CMD_WORD_STRUCT.pack(_FRAMING_WORD, 4 + _UINT16_STRUCT.size, cr_opcode, word)
+
+
+def _is_success(res, cr_opcode):
+    """
+        Checks whether res is a successful response to the command cr_opcode
+        
+        C/R & Opcode and status are decoded into ints in one go, instead of slicing them out of res
+    Args:
+        res (bytes): response from the UHF reader
+        cr_opcode (int): C/R + Opcode of the command
+    Returns:
+        bool: True if the reader responded to the command with success
+    """
+    return len(res) >= 8 and _RESPONSE_HEADER_STRUCT.unpack_from(res, 4) == (cr_opcode | _RESPONSE_FLAG_INT, _STATUS_SUCCESS_INT)
+
+
+def _parse_tx_power(res):
+    """
+        Parses a successful 'get TX power' response
+        example res: b'\xf6(\x00\x0e\x80\x06\x00\x00\x0b\xb8\x0b\xb8\x0b\xb8\x0b\xb8'
+    Returns:
+        dict: TX power of antennas 1-4 in dBm
+    """
+    # All four words come out of one unpack call and are scaled in one pass
+    return dict(zip(_TX_POWER_WORDS, (power/100 for power in _TX_POWER_STRUCT.unpack_from(res, 8))))
+
+
+def _parse_tag_report(res):
+    """
+        Parses a successful 'get tag report' response
+        example res: b'\xf6(\x00(\x80\t\x00\x00\x00\x06\x06\x07\xe7.b\xb65\xce\x00\x02\x00\x14\x01\x11\x08\x00\x00\x00\x00\x00\x00\x00\x02GQ\x00\x13\x00\x03\x9e\xff\x03'
+    Returns:
+        dict: tag report
+    """
+    rep, power_rssi_raw, power_dbm, timestamp, antenna, epc_length = _TAG_REPORT_STRUCT.unpack_from(res, 8)
+    
+    return {
+        "replyReason": _REPLY_REASONS.get(rep, 'Not defined'),  # Should never fall back to 'Not defined'
+        "powerRSSIRaw": power_rssi_raw,
+        "powerdBm": power_dbm,
+        "timestamp": timestamp,
+        "antenna": antenna,
+        "epcLength": epc_length              
+    }
+
+
+@dataclass(frozen=True)
+class UHFParams:
+    """
+        Parameters the client hands over (as a dict, see set_uhf_params) for a round of reading
+    """
+    tagReport: bool
+    soundEffect: bool
+    opRegion: str
+    ant1TxPower: float
+    ant2TxPower: float
+    ant3TxPower: float
+    ant4TxPower: float
+    ant1Enables: bool
+    ant2Enables: bool
+    ant3Enables: bool
+    ant4Enables: bool
+    
+    @classmethod
+    def from_dict(cls, params: dict):
+        """
+            Picks the parameters out of the dict sent by the client (other keys are ignored)
+        """
+        return cls(**{field.name: params[field.name] for field in fields(cls)})
+
+
 class UHFReaderThread(QThread):
     """
         Python class for USB/UART communication with a RAIN RFID UHF reader module
@@ -15,6 +215,15 @@ class UHFReaderThread(QThread):
 
     # Class constants
     REC_TIMEOUT = 1   # Receive timeout in seconds
+    SET_REC_TIMEOUT = 2   # Receive timeout in seconds for setters, the reader may take a while to apply a setting.
+                          # Long enough on its own, so there is no second (keep alive) round of waiting
+    TAG_READ_TIMEOUT = 10   # Time in seconds to wait for a tag to be reported once the reader is in the TAG_READ state
+    TAG_REPORT_RETRY_INTERVAL_MS = 100   # Pause in ms before asking again, after the reader answered without a tag
+    KEEP_ALIVE_MAX_RETRIES = 5   # Number of 'Keep-Alive' messages sent before giving up on the reader
+    KEEP_ALIVE_RETRY_INTERVAL_MS = 100   # Pause in ms after the first unanswered 'Keep-Alive', doubled after every further one
+    OPEN_MAX_RETRIES = 3   # Number of attempts to open the serial port
+    OPEN_RETRY_INTERVAL_MS = 500   # Pause in ms after the first failed attempt to open the serial port, doubled after every further one
+    KEEP_ALIVE_INTERVAL_S = 30   # Interval in seconds of the 'Keep-Alive' messages while waiting for the client to start reading
     
     
     def __init__(self, serial_port: SerialPort):
@@ -23,19 +232,53 @@ class UHFReaderThread(QThread):
         # Create a serial object for communication w/ the UHF reader
         self.ser = serial_port
         
-        # Mutex to handle uhf_params safely
-        self.mutex_uhf_params = QMutex()
+        # Reader metadata that cannot change while the serial port is open (e.g. version), queried only once
+        self._static = {}
+        # Operating region read back from the reader, valid until a different region is set
+        self._op_region_cached = None
+        self._last_op_region_set = None
+        
+        # Optional callable, invoked directly (in this thread) with every tag report. Unlike the pyqtSignals,
+        # which are meant for the hand-off to the GUI thread, it involves no Qt event queue
+        self.on_tag = None
+        
+        # Set when a response did not come in as expected, so it may still be on its way (or half read)
+        self._stale_input = False
+        # Error of the last command that failed on the serial link itself (no or incomplete response, I/O error)
+        self._link_error = None
+        
+        # Set along with startReading, wakes start_reading up as soon as the client orders to start reading
+        self.start_reading_event = threading.Event()
+        # (startReading, uhf_params) and start_reading_event are only ever updated together, under this lock
+        self._uhf_params_lock = threading.Lock()
         self.set_uhf_params(False, {})
         
+        # Commands without a payload never change, so build them only once
+        self._static_cmds = {
+            'GET_VERSION': _build_cmd_header(4, 0x0004),
+            'GET_TEMP': _build_cmd_header(4, 0x0013),
+            'GET_OP_REGION': _build_cmd_header(4, 0x0003),
+            'GET_TX_POWER': _build_cmd_header(4, 0x0006),
+            'GET_ANT_ENABLES': _build_cmd_header(4, 0x000F),
+            'GET_EVENT_MASK': _build_cmd_header(4, 0x0015),
+            'GET_OP_STATE': _build_cmd_header(4, 0x000D),
+            'KEEP_ALIVE': _build_cmd_header(4, 0x0001),
+            'GET_TAG_REPORT': _build_cmd_u16(0x0009, 0)  # EPC length 0
+        }
+        
     
     def run(self):   
-        print("UHF Reader started (QThread)...", flush=True)
+        """
+            All serial I/O is done here, in this thread, so blocking reads and waits (msleep) never involve 
+            the event loop of the GUI thread. Results are handed over through the pyqtSignals (queued connections)
+        """
+        log.info("UHF Reader started (QThread)...")
         self.start_reading()
         
     
     class UHFOperatingState():
-        IDLE = '0000'
-        TAG_READ = '0004'
+        IDLE = 0x0000
+        TAG_READ = 0x0004
     
     
     class Events():
@@ -55,57 +298,70 @@ class UHFReaderThread(QThread):
             Struct to hold operational parameters
         """
         TAG_TIMEOUT = 'Tag Time Out'
-        TAG_TIMEOUT_CODE = '0001'
+        TAG_TIMEOUT_CODE = 0x0001
         TAG_POWER_CHANGE_THRESHOLD = 'Tag_Power_Change_Threshold'
-        TAG_POWER_CHANGE_THRESHOLD_CODE = '0002'
+        TAG_POWER_CHANGE_THRESHOLD_CODE = 0x0002
         TAG_REPORT_TIMEOUT = 'Tag_Report_Timeout'
-        TAG_REPORT_TIMEOUT_CODE = '0003'
+        TAG_REPORT_TIMEOUT_CODE = 0x0003
         TRANSIENT_DETECT_TIME = 'Transient_Detect_Time'
-        TRANSIENT_DETECT_TIME_CODE = '0004'
+        TRANSIENT_DETECT_TIME_CODE = 0x0004
         TRANSIENT_COUNT = 'Transient_Count'
-        TRANSIENT_COUNT_CODE = '0005'
+        TRANSIENT_COUNT_CODE = 0x0005
         TRANSIENT_INTERVAL = 'Transient_Interval'
-        TRANSIENT_INTERVAL_CODE = '0006'
+        TRANSIENT_INTERVAL_CODE = 0x0006
         GEN2_OP_TIMEOUT = 'Gen2_Op_Timeout'  
-        GEN2_OP_TIMEOUT_CODE = '0007' 
+        GEN2_OP_TIMEOUT_CODE = 0x0007 
         RESPONSE_NOT_DEFINED = 'Response_Not_Defined'                  
+    
+    # Operational parameter codes to operational parameters
+    _CODE_TO_PARAM = {
+        OPParams.TAG_TIMEOUT_CODE: OPParams.TAG_TIMEOUT,
+        OPParams.TAG_POWER_CHANGE_THRESHOLD_CODE: OPParams.TAG_POWER_CHANGE_THRESHOLD,
+        OPParams.TAG_REPORT_TIMEOUT_CODE: OPParams.TAG_REPORT_TIMEOUT,
+        OPParams.TRANSIENT_DETECT_TIME_CODE: OPParams.TRANSIENT_DETECT_TIME,
+        OPParams.TRANSIENT_COUNT_CODE: OPParams.TRANSIENT_COUNT,
+        OPParams.TRANSIENT_INTERVAL_CODE: OPParams.TRANSIENT_INTERVAL,
+        OPParams.GEN2_OP_TIMEOUT_CODE: OPParams.GEN2_OP_TIMEOUT
+    }
+        
         
     class UHFBytes():
         """
-            Struct to hold KNOWN bytes from the UHF reader
+            Struct to hold KNOWN bytes from the UHF reader (aliases of the module-level constants)
         """
         # C/R & Opcode in the response message
-        GET_VERSION = b'\x80\x04'
-        GET_TEMP = b'\x80\x13'
-        GET_OP_REGION = b'\x80\x03'
-        SET_OP_REGION = b'\x80\x02'  
-        GET_OP_PARAMS = b'\x80\x0B'
-        SET_OP_PARAMS = b'\x80\x0A'
-        GET_EVENT_MASK = b'\x80\x15'
-        SET_EVENT_MASK = b'\x80\x14'   
-        SET_TX_POWER = b'\x80\x05'
-        GET_TX_POWER = b'\x80\x06'
-        SET_ANT_ENABLES = b'\x80\x0E'
-        GET_ANT_ENABLES = b'\x80\x0F'
-        SET_OP_STATE = b'\x80\x0C'
-        GET_OP_STATE = b'\x80\x0D'
-        GET_TAG_REPORT = b'\x80\x09'
-        KEEP_ALIVE = b'\x80\x01'
+        GET_VERSION = GET_VERSION
+        GET_TEMP = GET_TEMP
+        GET_OP_REGION = GET_OP_REGION
+        SET_OP_REGION = SET_OP_REGION
+        GET_OP_PARAMS = GET_OP_PARAMS
+        SET_OP_PARAMS = SET_OP_PARAMS
+        GET_EVENT_MASK = GET_EVENT_MASK
+        SET_EVENT_MASK = SET_EVENT_MASK
+        SET_TX_POWER = SET_TX_POWER
+        GET_TX_POWER = GET_TX_POWER
+        SET_ANT_ENABLES = SET_ANT_ENABLES
+        GET_ANT_ENABLES = GET_ANT_ENABLES
+        SET_OP_STATE = SET_OP_STATE
+        GET_OP_STATE = GET_OP_STATE
+        GET_TAG_REPORT = GET_TAG_REPORT
+        KEEP_ALIVE = KEEP_ALIVE
         # Status bytes
-        STATUS_SUCCESS = b'\x00\x00'   
-        STATUS_OP_REGION_INVALID = b'\x00\x05' 
-        STATUS_INVALID_POWER_LEVEL = b'\x00\x06'  
-        STATUS_INTERNAL_ERROR = b'\x00\x07'      
+        STATUS_SUCCESS = STATUS_SUCCESS
+        STATUS_OP_REGION_INVALID = STATUS_OP_REGION_INVALID
+        STATUS_INVALID_POWER_LEVEL = STATUS_INVALID_POWER_LEVEL
+        STATUS_INTERNAL_ERROR = STATUS_INTERNAL_ERROR
         # Framing bytes
-        FRAMING_BYTES = b'\xf6('
-        FRAMING_BYTES_LEN = 2
+        FRAMING_BYTES = FRAMING_BYTES
+        FRAMING_BYTES_LEN = FRAMING_BYTES_LEN
         
     
     def create_event_mask(self, tag_seen, tag_removed, tag_power_change, tag_report_timeout, gen2_op_completed, gen2_op_timeout):
         """
             Creates an event mask
         """
-        event_mask = int('00{}{}{}{}{}{}'.format(gen2_op_timeout, gen2_op_completed, tag_report_timeout, tag_power_change, tag_removed, tag_seen), 2)
+        event_mask = ((int(gen2_op_timeout) << 5) | (int(gen2_op_completed) << 4) | (int(tag_report_timeout) << 3) |
+                      (int(tag_power_change) << 2) | (int(tag_removed) << 1) | int(tag_seen))
         # event_mask = '{:032b}'.format(event_mask)
                 
         return event_mask
@@ -113,37 +369,40 @@ class UHFReaderThread(QThread):
     
     def set_uhf_params(self, status, params):
         """
-            Sets UHF parameters safely using mutex lock
+            Sets UHF parameters safely, together with start_reading_event (under a lock)
+            
+            Setting status to True also wakes start_reading up (start_reading_event)
         """
-        if self.mutex_uhf_params.tryLock(-1):  
-            # print("UHF params: {}".format(params), flush=True)             
-            self.startReading = status        
-            self.uhf_params = params  
-            self.mutex_uhf_params.unlock()
+        # log.debug("UHF params: %s", params)
+        with self._uhf_params_lock:
+            self._uhf_state = (status, params)
+            if status:
+                self.start_reading_event.set()
+            else:
+                self.start_reading_event.clear()
             
             
     def get_uhf_params(self):
         """
-            Gets UHF parameters safely using mutex lock
+            Gets UHF parameters safely (under a lock)
         """
-        if self.mutex_uhf_params.tryLock(-1):  
-            # print("UHF params: {}".format(params), flush=True)            
-            status = self.startReading
-            params = self.uhf_params
-            self.mutex_uhf_params.unlock()
+        with self._uhf_params_lock:
+            status, params = self._uhf_state
+        # log.debug("UHF params: %s", params)
         return params, status
     
     
-    def bit_status(self, x, n):
+    def take_uhf_params(self):
         """
-            Checks whether n^th bit is set or not
-        Args:
-            x (int): 16-bit integer
-            n (int): nth bit to check
-        Returns:
-            bool: True if the bit is set, False otherwise
+            Gets the UHF parameters and resets them to (False, {}) in one locked step, so an order to 
+            start reading given in between is neither lost nor half read
         """
-        return x & 1 << n != 0
+        with self._uhf_params_lock:
+            status, params = self._uhf_state
+            self._uhf_state = (False, {})
+            self.start_reading_event.clear()
+        
+        return params, status
     
     
     def int_to_hex_string(self, value: int, str_len: int = 4):
@@ -155,8 +414,7 @@ class UHFReaderThread(QThread):
         Returns:
             hex string
         """
-        value_hex = format(value, 'x')
-        hex_str = value_hex.rjust(str_len, '0')
+        hex_str = f'{value:0{str_len}x}'
         
         return hex_str
     
@@ -181,35 +439,44 @@ class UHFReaderThread(QThread):
     
     def code_to_param(self, code):
         """
-            Converts code (hex or hex string) to operational parameter (string)
+            Converts code (int) to operational parameter (string)
         """
-        if type(code) is int:
-            code_hex_string = '{:04x}'.format(code)
-        else:
-            code_hex_string = code
-        
-        match code_hex_string:
-            case '0001':
-                param = self.OPParams.TAG_TIMEOUT
-            case '0002':
-                param = self.OPParams.TAG_POWER_CHANGE_THRESHOLD
-            case '0003':
-                param = self.OPParams.TAG_REPORT_TIMEOUT
-            case '0004':
-                param = self.OPParams.TRANSIENT_DETECT_TIME
-            case '0005':
-                param = self.OPParams.TRANSIENT_COUNT
-            case '0006':
-                param = self.OPParams.TRANSIENT_INTERVAL
-            case '0007':
-                param = self.OPParams.GEN2_OP_TIMEOUT  
-            case _:
-                # Should never hit this line
-                param = self.OPParams.RESPONSE_NOT_DEFINED
+        # Should never fall back to RESPONSE_NOT_DEFINED
+        param = self._CODE_TO_PARAM.get(code, self.OPParams.RESPONSE_NOT_DEFINED)
                 
         return param
         
 
+    def open_serial_port(self):
+        """
+            Opens the serial port, retrying with an exponential backoff, and gets it ready for the UHF reader
+        Returns:
+            str: error (if any)
+        """
+        error = None
+        retry_interval_ms = self.OPEN_RETRY_INTERVAL_MS
+        for attempt in range(1, self.OPEN_MAX_RETRIES + 1):
+            error = self.ser.serial_open()
+            if error is None:
+                break
+            if attempt < self.OPEN_MAX_RETRIES:
+                self.msleep(retry_interval_ms)
+                retry_interval_ms *= 2
+        
+        if error is None:
+            # Don't let the USB-serial latency timer delay every response
+            self.ser.set_low_latency()
+            # Whatever was learned about the reader over a previous connection may be outdated
+            self._static = {}
+            self._op_region_cached = None
+            self._last_op_region_set = None
+            # serial_open has flushed the buffers already
+            self._stale_input = False
+        self._link_error = error
+        
+        return error
+    
+    
     def close_serial_port(self):
         # Close the serial port
         error = self.ser.serial_close() 
@@ -217,71 +484,47 @@ class UHFReaderThread(QThread):
         return error        
         
         
+    def reopen_serial_port_on_link_error(self):
+        """
+            Closes and reopens the serial port if the last command failed on the serial link itself, e.g. because 
+            the USB-serial adapter was unplugged. pyserial keeps is_open True after such an I/O error, so the 
+            port has to be closed explicitly before it can be opened again
+        Returns:
+            bool: True if the port was reopened
+        """
+        if self._link_error is None:
+            return False
+        
+        log.warning("Serial link error (%s), reopening the serial port...", self._link_error)
+        self.close_serial_port()
+        
+        return self.open_serial_port() is None
+        
+        
     def wait_for_response_short(self, set_response, rec_timeout = REC_TIMEOUT):
         """
             Waits for a response from the UHF reader 
+            
+            The response frame is read with exact-length reads (framing bytes, length, rest of the frame), 
+            so the method returns as soon as the expected frame is complete
         Args:
+            set_response (bytes): response to expect from the UHF reader
             rec_timeout (float): time to wait for a response from the UHF reader in seconds. Defaults to REC_TIMEOUT
         Returns:
             tuple: 
                 error (str): any error occurred during the process
                 res (bytes): response from the UHF reader
         """
-        # Get the response
-        # print("Awaiting a response...", flush=True)
-        
-        res = None
-        error = None
-        error, res = self.ser.serial_receive(rec_timeout)         
-        # Trim (synchronize?) the frame by getting rid of any bytes related to the 'keep alive' or additional framing bytes
-        res_trimmed = res.split(self.UHFBytes.FRAMING_BYTES) 
-        if len(res_trimmed) > 2:
-            res = self.UHFBytes.FRAMING_BYTES + res_trimmed[2]
-            if res[4:6] == set_response:
-                pass
-            else:
-                res = self.UHFBytes.FRAMING_BYTES + res_trimmed[1]
-        
-        # Cut the response to its expected length
-        length = int.from_bytes(res[2:4], 'big') + self.UHFBytes.FRAMING_BYTES_LEN
-        # print("[wait_for_response_short] length: {}".format(length), flush=True)
-        res = res[:length]
+        # Get the response, skipping any 'keep alive' or additional frames before it
+        # log.debug("Awaiting a response...")
+        error, res = self.ser.serial_receive_frame(FRAMING_BYTES, set_response, rec_timeout)
         
         # if error is None:
-        #     print("response: {}".format(res), flush=True)  
+        #     log.debug("response: %s", res)
  
         return error, res
     
     
-    def wait_for_response_long(self, set_response): 
-        """
-            Waits for the UHF reader to complete param set (by sending keep alive) and returning a response
-        Args:
-            set_response (bytes): response to expect from the UHF reader
-        Returns:
-            status (bool): True if the response was received. False otherwise
-        """
-        # Build a 'keep alive' message/command
-        length = '0004'
-        cr_opcode = '0001' 
-        msg = self.build_cmd(length=length, cr_opcode=cr_opcode)
-
-        # Loop until the UHF reader tells the param is set!
-        count = 0
-        res = None
-        error = None     
-        while count < 5:
-            count += 1
-            error = self.send_cmd(msg)
-            if error is None:
-                error, res = self.wait_for_response_short(set_response)
-                if res[4:6] == set_response:
-                    break
-            wait_ms(1000)
-      
-        return error, res
-    
-    
     def send_cmd(self, cmd: bytes):
         """
             Sends a command to the UHF reader and returns the response
@@ -294,85 +537,90 @@ class UHFReaderThread(QThread):
         error = self.ser.serial_send(cmd)   
 
         return error
-
+    
+    
+    def transact(self, msg: bytes, set_response, rec_timeout = REC_TIMEOUT):
+        """
+            Sends a command to the UHF reader and waits for its response in one go
+            
+            Frames of other responses (e.g. 'keep alive') are skipped while waiting. The input is only flushed
+            before sending if the previous response did not come in as expected, as it may still arrive late
+        Args:
+            msg (bytes): command to send
+            set_response (bytes): response to expect from the UHF reader
+            rec_timeout (float): time to wait for a response from the UHF reader in seconds. Defaults to REC_TIMEOUT
+        Returns:
+            tuple: 
+                error (str): any error occurred during the process
+                res (bytes): response from the UHF reader (None if the command could not be sent)
+        """
+        res = None
+        if self._stale_input:
+            self.ser.flush_buffers()
+            self._stale_input = False
+        error = self.send_cmd(msg)
+        if error is None:
+            error, res = self.wait_for_response_short(set_response, rec_timeout)
+            self._stale_input = error is not None or not res.startswith(set_response, 4)
+        # Any error up to here comes from the serial link, not from the status of the response
+        self._link_error = error
         
-    def build_cmd(self, length, cr_opcode, word1 = None, word2 = None, word3 = None, word4 = None, word_type = 'str'):
+        return error, res
+    
+    
+    def _cmd(self, name, payload = b'', error_msg = None, min_len = 8, rec_timeout = REC_TIMEOUT):
         """
-            Builds a UHF command
+            Sends one of the commands in _COMMANDS to the UHF reader and checks the status of its response
             
-            "The overall format of a message starts with the following 6 byte header. The first two bytes contain a
-            fixed framing pattern of 0xF628. The next two bytes contain the length of the message, including the 2
-            length bytes but excluding the two framing bytes. The next two bytes contain a 15 bit opcode and a 1
-            bit Command/Response indication."
+            Commands without a payload come prebuilt from _static_cmds, commands with a single 16-bit word are 
+            packed in one go (_build_cmd_u16), the others get their header packed here
         Args:
-            length (_type_): length of the message
-            cr_opcode (_type_): C/R + Opcode (15 bit opcode and a 1 bit Command/Response indication)
+            name (str): name of the command (key of _COMMANDS)
+            payload (bytes or int): bytes following the header of the command, if any, or an int for a payload 
+                                    of a single unsigned 16-bit word
+            error_msg (str): error to report if the reader did not respond with success. The response is not checked if None
+            min_len (int): minimum length of a valid response in bytes (framing bytes included)
+            rec_timeout (float): time to wait for a response from the UHF reader in seconds. Defaults to REC_TIMEOUT
         Returns:
-            bytes: built message in bytes
-        """
-        _FRAMING_BYTES = "F6 28" 
-        msg_str = "{} {} {}".format(_FRAMING_BYTES, length, cr_opcode) 
-        if word1 is not None: 
-            if word_type == 'str':
-                msg_bytes = bytes.fromhex(msg_str) + bytes(word1, "utf-8") + b'\x00'             
-            elif word_type == 'int':
-                if (word2 is None) and (word3 is None) and (word4 is None):
-                    msg_bytes = bytes.fromhex(msg_str) + word1.to_bytes(2, 'big')
-                else:
-                    msg_bytes = bytes.fromhex(msg_str) + word1.to_bytes(2, 'big') + word2.to_bytes(2, 'big') + word3.to_bytes(2, 'big') + word4.to_bytes(2, 'big')            
-            elif word_type == 'int32':
-                msg_bytes = bytes.fromhex(msg_str) + word1.to_bytes(4, 'big')
-            elif word_type == 'uint32_t':
-                msg_bytes = bytes.fromhex(msg_str) + bytes.fromhex(word1) + word2.to_bytes(4, 'big')            
-            elif word_type == 'byt':
-                msg_bytes = bytes.fromhex(msg_str) + bytes.fromhex(word1)
-                
-            # Add zeros for the remaining bytes up to the length of the command
-            for i in range(int(length, 16) - len(msg_bytes)):
-                msg_bytes += b'\x00'
-                
+            tuple: 
+                error (str): any error occurred during the process
+                res (bytes): response from the UHF reader (None if the command could not be sent)
+        """
+        cr_opcode, response = _COMMANDS[name]
+        if isinstance(payload, int):
+            msg = _build_cmd_u16(cr_opcode, payload)
+        elif payload:
+            msg = _build_cmd_header(4 + len(payload), cr_opcode) + payload
         else:
-            msg_bytes = bytes.fromhex(msg_str)
-            
-        # print("Command bytes: {}".format(msg_bytes), flush=True)
+            msg = self._static_cmds.get(name) or _build_cmd_header(4, cr_opcode)
         
-        return msg_bytes
-
-
+        error, res = self.transact(msg, response, rec_timeout)
+        
+        if error is None and error_msg is not None:
+            if not _is_success(res, cr_opcode) or len(res) < min_len:
+                error = error_msg
+                log.error(error)
+        
+        return error, res
+    
+    
     def get_version(self):
         """
             Gets UHF reader version information
         """
-        print("Getting UHF reader version information...", flush=True) 
-        length = '0004'
-        cr_opcode = '0004' 
-        msg = self.build_cmd(length=length, cr_opcode=cr_opcode)
-        
-        res = None
-        error = None
-        error = self.send_cmd(msg)
-        if error is None:
-            wait_ms(500)
-            error, res = self.wait_for_response_short(self.UHFBytes.GET_VERSION)
+        log.debug("Getting UHF reader version information...") 
+        error, res = self._cmd('GET_VERSION', error_msg="Unable to get device version information")
         
         version = None  
         if error is None:
-            if res[6:8] == self.UHFBytes.STATUS_SUCCESS and res[4:6] == self.UHFBytes.GET_VERSION:
-                # parse response and get version info
-                # example res = b'\xf6(\x00\x1c\x80\x04\x00\x001.2.0\x001.2.0\x002.0.0\x001.0\x00'
-                Firmware_rev = res[8:13].decode('utf-8')
-                SDK_rev = res[14:19].decode('utf-8')
-                Software_rev = res[20:25].decode('utf-8')
-                Hardware_rev = res[26:29].decode('utf-8')
-                version = {
-                    "FirmwareRev": Firmware_rev,
-                    "SDKRev": SDK_rev,
-                    "SoftwareRev": Software_rev,
-                    "HardwareRev": Hardware_rev
-                }
-            else:
-                error = "Unable to get device version information"
-                print(error, flush=True)
+            # parse response and get version info
+            # example res = b'\xf6(\x00\x1c\x80\x04\x00\x001.2.0\x001.2.0\x002.0.0\x001.0\x00'
+            version = {
+                "FirmwareRev": res[8:13].decode('utf-8'),
+                "SDKRev": res[14:19].decode('utf-8'),
+                "SoftwareRev": res[20:25].decode('utf-8'),
+                "HardwareRev": res[26:29].decode('utf-8')
+            }
                             
         return error, version
     
@@ -381,27 +629,14 @@ class UHFReaderThread(QThread):
         """
             Gets UHF reader temperature
         """
-        print("Getting UHF reader temperature...", flush=True) 
-        length = '0004'
-        cr_opcode = '0013' 
-        msg = self.build_cmd(length=length, cr_opcode=cr_opcode)
-        
-        res = None
-        error = None
-        error = self.send_cmd(msg)
-        if error is None:
-            wait_ms(500)
-            error, res = self.wait_for_response_short(self.UHFBytes.GET_TEMP)
+        log.debug("Getting UHF reader temperature...") 
+        error, res = self._cmd('GET_TEMP', error_msg="Unable to get temperature", min_len=8 + _TEMP_STRUCT.size)
         
         temperature = None
         if error is None:
-            if res[6:8] == self.UHFBytes.STATUS_SUCCESS and res[4:6] == self.UHFBytes.GET_TEMP:
-                # parse response and get temp from res
-                # example res = b'\xf6(\x00\x08\x80\x13\x00\x00\x10d'
-                temperature = int.from_bytes(res[8:len(res)], 'big')/100
-            else:
-                error = "Unable to get temperature"
-                print(error, flush=True)
+            # parse response and get temp from res
+            # example res = b'\xf6(\x00\x08\x80\x13\x00\x00\x10d'
+            temperature = _TEMP_STRUCT.unpack_from(res, 8)[0]/100
                             
         return error, temperature
 
@@ -409,36 +644,22 @@ class UHFReaderThread(QThread):
     def get_operational_params(self, code):
         """
             Gets the operational parameters
+        Args:
+            code (int): code of the operational parameter (e.g. OPParams.TAG_TIMEOUT_CODE)
         """
         param = self.code_to_param(code)                
-        print("Getting value for operational param '{}'...".format(param), flush=True)
-        length = '0006'
-        cr_opcode = '000B'  
-        msg = self.build_cmd(length=length, cr_opcode=cr_opcode, word1=code, word_type='byt')
-        
-        res = None
-        error = None
-        error = self.send_cmd(msg)
-        if error is None:
-            wait_ms(500)
-            error, res = self.wait_for_response_short(self.UHFBytes.GET_OP_PARAMS)
+        log.debug("Getting value for operational param '%s'...", param)
+        error, res = self._cmd('GET_OP_PARAMS', code, error_msg="Unable to get operational parameters", min_len=8 + _OP_PARAM_STRUCT.size)
         
         op_param = None    
         if error is None:
-            if res[6:8] == self.UHFBytes.STATUS_SUCCESS and res[4:6] == self.UHFBytes.GET_OP_PARAMS:
-                # parse response (res)
-                # example res: b'\xf6(\x00\x0c\x80\x0b\x00\x00\x00\x01\x00\x00\xea`'
-                rep = int.from_bytes(res[8:10], 'big') 
-                param = self.code_to_param(rep)                                         
-                value = int.from_bytes(res[10:], 'big')
-                
-                op_param = {
-                    "param": param,
-                    "value": value
-                }              
-            else:
-                error = "Unable to get operational parameters"
-                print(error, flush=True)
+            # parse response (res)
+            # example res: b'\xf6(\x00\x0c\x80\x0b\x00\x00\x00\x01\x00\x00\xea`'
+            rep, value = _OP_PARAM_STRUCT.unpack_from(res, 8)
+            op_param = {
+                "param": self.code_to_param(rep),
+                "value": value
+            }              
                 
         return error, op_param    
     
@@ -446,27 +667,14 @@ class UHFReaderThread(QThread):
     def set_operational_param(self, code, value):
         """
             Sets the operational parameters
+        Args:
+            code (int): code of the operational parameter (e.g. OPParams.TAG_TIMEOUT_CODE)
+            value (int): unsigned 32-bit value
         """
         param = self.code_to_param(code)  
-        print("Setting operational param '{}' to '{}'...".format(param, value), flush=True)
-        length = '000A'
-        cr_opcode = '000A'   
-        msg = self.build_cmd(length, cr_opcode, word1=code, word2=value, word_type='uint32_t')
-        
-        res = None
-        error = None
-        error = self.send_cmd(msg)
-        if error is None:
-            wait_ms(1000)
-            error, res = self.wait_for_response_short(self.UHFBytes.SET_OP_PARAMS)
-            if res == b'':
-                error, res = self.wait_for_response_long(self.UHFBytes.SET_OP_PARAMS)
-               
-        if error is None:
-            # parse response (res)           
-            if not res[6:8] == self.UHFBytes.STATUS_SUCCESS and res[4:6] == self.UHFBytes.SET_OP_PARAMS:
-                error = "Unable to set '{}' to '{}'".format(param, value)
-                print(error, flush=True)
+        log.debug("Setting operational param '%s' to '%s'...", param, value)
+        payload = _OP_PARAM_STRUCT.pack(code, value)
+        error, res = self._cmd('SET_OP_PARAMS', payload, "Unable to set '{}' to '{}'".format(param, value), rec_timeout=self.SET_REC_TIMEOUT)
                 
         return error
        
@@ -476,45 +684,17 @@ class UHFReaderThread(QThread):
             Gets event mask
             TODO: Needs more work. Because of errors in the module Binary-Interface (datasheet), I wasn't able to finalize this method and verify it works.
         """                        
-        print("Getting 32-bit event mask...", flush=True)
-        length = '0004'
-        cr_opcode = '0015'  
-        msg = self.build_cmd(length=length, cr_opcode=cr_opcode)
-        print(msg, flush=True)
-        
-        res = None
-        error = None
-        error = self.send_cmd(msg)
-        if error is None:
-            wait_ms(500)
-            error, res = self.wait_for_response_short(self.UHFBytes.GET_EVENT_MASK)
+        log.debug("Getting 32-bit event mask...")
+        error, res = self._cmd('GET_EVENT_MASK', error_msg="Unable to get event mask", min_len=8 + _EVENT_MASK_STRUCT.size)
             
-        print(res, flush=True)
+        log.debug("%s", res)
         
         event_mask = None    
         if error is None:
-            if res[6:8] == self.UHFBytes.STATUS_SUCCESS and res[4:6] == self.UHFBytes.GET_EVENT_MASK:
-                # parse response (res)
-                # example res: 
-                mask_32bits = int.from_bytes(res[8:len(res)], 'big')                
-                tag_seen = self.bit_status(mask_32bits,0)
-                tag_removed = self.bit_status(mask_32bits,1)
-                tag_power_change = self.bit_status(mask_32bits,2)
-                tag_report_timeout = self.bit_status(mask_32bits,3)
-                gen2_op_completed = self.bit_status(mask_32bits,4)
-                gen2_op_timeout = self.bit_status(mask_32bits,5)
-                
-                event_mask = {
-                    "tag_seen": tag_seen,
-                    "tag_removed": tag_removed,
-                    "tag_power_change": tag_power_change,
-                    "tag_report_timeout": tag_report_timeout,
-                    "gen2_op_completed": gen2_op_completed,
-                    "gen2_op_timeout": gen2_op_timeout
-                }           
-            else:
-                error = "Unable to get event mask"
-                print(error, flush=True)
+            # parse response (res)
+            # example res: 
+            mask_32bits = _EVENT_MASK_STRUCT.unpack_from(res, 8)[0]                
+            event_mask = dict(zip(_EVENT_MASK_BITS, (bool((mask_32bits >> i) & 1) for i in range(len(_EVENT_MASK_BITS)))))
                 
         return error, event_mask 
         
@@ -524,28 +704,11 @@ class UHFReaderThread(QThread):
             Sets 32-bit event mask
             TODO: Needs more work. Because of errors in the module Binary-Interface (datasheet), I wasn't able to finalize this method and verify it works.
         """
-        print("Setting 32-bit event mask...", flush=True)
-        length = '0008'
-        cr_opcode = '0014'         
-        event_mask = int('00{}{}{}{}{}{}'.format(gen2_op_timeout, gen2_op_completed, tag_report_timeout, tag_power_change, tag_removed, tag_seen), 2)
-        msg = self.build_cmd(length, cr_opcode, word1=event_mask, word_type='int32')
-        
-        res = None
-        error = None
-        error = self.send_cmd(msg)
-        if error is None:
-            wait_ms(1000)
-            error, res = self.wait_for_response_short(self.UHFBytes.SET_EVENT_MASK)
-            if res == b'':
-                error, res = self.wait_for_response_long(self.UHFBytes.SET_EVENT_MASK)
+        log.debug("Setting 32-bit event mask...")
+        event_mask = self.create_event_mask(tag_seen, tag_removed, tag_power_change, tag_report_timeout, gen2_op_completed, gen2_op_timeout)
+        error, res = self._cmd('SET_EVENT_MASK', _UINT32_STRUCT.pack(event_mask), "Unable to set event mask!", rec_timeout=self.SET_REC_TIMEOUT)
         
-        print(res, flush=True)
-              
-        if error is None:
-            # parse response (res)
-            if not res[6:10] == self.UHFBytes.STATUS_SUCCESS and res[4:6] == self.UHFBytes.SET_EVENT_MASK:
-                error = "Unable to set event mask!"
-                print(error, flush=True)
+        log.debug("%s", res)
                 
         return error
     
@@ -554,27 +717,14 @@ class UHFReaderThread(QThread):
         """
             Gets current operating region
         """
-        print("Getting current operating region...", flush=True)
-        length = '0004'
-        cr_opcode = '0003'         
-        msg = self.build_cmd(length=length, cr_opcode=cr_opcode)
-        
-        res = None
-        error = None
-        error = self.send_cmd(msg)
-        if error is None:
-            wait_ms(500)
-            error, res = self.wait_for_response_short(self.UHFBytes.GET_OP_REGION)
+        log.debug("Getting current operating region...")
+        error, res = self._cmd('GET_OP_REGION', error_msg="Unable to get operating region")
         
         op_region = None    
         if error is None:
-            if res[6:8] == self.UHFBytes.STATUS_SUCCESS and res[4:6] == self.UHFBytes.GET_OP_REGION:
-                # parse response (res)
-                # example res: b'\xf6(\x00\n\x80\x03\x00\x00FCC\x00'
-                op_region = res[8:11].decode('utf-8')
-            else:
-                error = "Unable to get operating region"
-                print(error, flush=True)
+            # parse response (res)
+            # example res: b'\xf6(\x00\n\x80\x03\x00\x00FCC\x00'
+            op_region = res[8:11].decode('utf-8')
                 
         return error, op_region
 
@@ -583,28 +733,20 @@ class UHFReaderThread(QThread):
         """
             Sets current operating region
         """
-        print("Setting operating region...", flush=True)        
-        length = self.int_to_hex_string(4 + len(opRegion) + 1)                
-        cr_opcode = '0002'         
-        op_reg = opRegion
-        msg = self.build_cmd(length, cr_opcode, word1=op_reg)
-        
-        res = None
-        error = None
-        error = self.send_cmd(msg)
-        if error is None:
-            error, res = self.wait_for_response_short(self.UHFBytes.SET_OP_REGION)
+        log.debug("Setting operating region...")        
+        # The region is sent as a null-terminated string
+        error, res = self._cmd('SET_OP_REGION', bytes(opRegion, "utf-8") + b'\x00')
              
         if error is None:
             # parse response (res)
-            if res[6:8] == self.UHFBytes.STATUS_SUCCESS and res[4:6] == self.UHFBytes.SET_OP_REGION:
+            if _is_success(res, _COMMANDS['SET_OP_REGION'][0]):
                 pass
-            elif not res[6:8] == self.UHFBytes.STATUS_SUCCESS:
+            elif len(res) < 8 or _RESPONSE_HEADER_STRUCT.unpack_from(res, 4)[1] != _STATUS_SUCCESS_INT:
                 error = "Invalid operating region: {}".format(opRegion)
-                print(error, flush=True)
+                log.error(error)
             else:
                 error = "Unable to set operating region"
-                print(error, flush=True)
+                log.error(error)
                 
         return error
     
@@ -613,36 +755,13 @@ class UHFReaderThread(QThread):
         """
             Gets TX power for all four antennas
         """
-        print("Getting TX power...", flush=True)
-        length = '0004'
-        cr_opcode = '0006'         
-        msg = self.build_cmd(length=length, cr_opcode=cr_opcode)
-        
-        res = None
-        error = None
-        error = self.send_cmd(msg)
-        if error is None:
-            wait_ms(500)
-            error, res = self.wait_for_response_short(self.UHFBytes.GET_TX_POWER)
+        log.debug("Getting TX power...")
+        error, res = self._cmd('GET_TX_POWER', error_msg="Unable to get TX power", min_len=8 + _TX_POWER_STRUCT.size)
         
         tx_power = None         
         if error is None:
-            if res[6:8] == self.UHFBytes.STATUS_SUCCESS and res[4:6] == self.UHFBytes.GET_TX_POWER:
-                # parse response (res)
-                # example res: b'\xf6(\x00\x0e\x80\x06\x00\x00\x0b\xb8\x0b\xb8\x0b\xb8\x0b\xb8'
-                ant_1_power = int.from_bytes(res[8:10], 'big')/100
-                ant_2_power = int.from_bytes(res[10:12], 'big')/100
-                ant_3_power = int.from_bytes(res[12:14], 'big')/100
-                ant_4_power = int.from_bytes(res[14:16], 'big')/100
-                tx_power = {
-                    "ant1power": ant_1_power,
-                    "ant2power": ant_2_power,
-                    "ant3power": ant_3_power,
-                    "ant4power": ant_4_power
-                }
-            else:
-                error = "Unable to get TX power"
-                print(error, flush=True)
+            # parse response (res)
+            tx_power = _parse_tx_power(res)
                 
         return error, tx_power
         
@@ -651,97 +770,72 @@ class UHFReaderThread(QThread):
         """
             Sets TX power for all four antennas
         """
-        print("Setting TX power for antennas 1-4...", flush=True)
-        length = '000C'
-        cr_opcode = '0005'         
-        ant_power1 = int(ant1TxPower * 100)
-        ant_power2 = int(ant2TxPower * 100)
-        ant_power3 = int(ant3TxPower * 100)
-        ant_power4 = int(ant4TxPower * 100)
-        msg = self.build_cmd(length, cr_opcode, word1=ant_power1, word2=ant_power2, word3=ant_power3, word4=ant_power4, word_type='int')
-        
-        res = None
-        error = None
-        error = self.send_cmd(msg)
-        if error is None:
-            wait_ms(1000)
-            error, res = self.wait_for_response_short(self.UHFBytes.SET_TX_POWER)
-            if res == b'':
-                error, res = self.wait_for_response_long(self.UHFBytes.SET_TX_POWER)
-               
-        if error is None:
-            # parse response (res)
-            if not res[6:8] == self.UHFBytes.STATUS_SUCCESS and res[4:6] == self.UHFBytes.SET_TX_POWER:
-                error = "Unable to set tx power to {}, {}, {}, {}".format(ant1TxPower, ant2TxPower, ant3TxPower, ant4TxPower)
-                print(error, flush=True)
+        log.debug("Setting TX power for antennas 1-4...")
+        # TX power is sent in 1/100 dBm
+        payload = _TX_POWER_STRUCT.pack(int(ant1TxPower * 100), int(ant2TxPower * 100), int(ant3TxPower * 100), int(ant4TxPower * 100))
+        error_msg = "Unable to set tx power to {}, {}, {}, {}".format(ant1TxPower, ant2TxPower, ant3TxPower, ant4TxPower)
+        error, res = self._cmd('SET_TX_POWER', payload, error_msg, rec_timeout=self.SET_REC_TIMEOUT)
                 
         return error
 
 
-    def get_tag_report(self):
+    def get_tag_report(self, rec_timeout = REC_TIMEOUT):
         """
             Gets tag report
+        Args:
+            rec_timeout (float): time to wait for the report in seconds. Defaults to REC_TIMEOUT
         """
-        print("Getting tag report...", flush=True)
-        length = '0006'
-        cr_opcode = '0009'   
-        epc_length = '0000'      
-        msg = self.build_cmd(length, cr_opcode, word1=epc_length, word_type='byt')
-        
-        res = None
-        error = None
-        error = self.send_cmd(msg)
-        if error is None:
-            wait_ms(500)
-            error, res = self.wait_for_response_short(self.UHFBytes.GET_TAG_REPORT)
+        log.debug("Getting tag report...")
+        error, res = self._cmd('GET_TAG_REPORT', error_msg="Unable to get a tag report", min_len=8 + _TAG_REPORT_STRUCT.size, rec_timeout=rec_timeout)
 
         tag_report = None    
         if error is None:
-            if res[6:8] == self.UHFBytes.STATUS_SUCCESS and res[4:6] == self.UHFBytes.GET_TAG_REPORT:
-                # parse response (res)
-                # example res: b'\xf6(\x00(\x80\t\x00\x00\x00\x06\x06\x07\xe7.b\xb65\xce\x00\x02\x00\x14\x01\x11\x08\x00\x00\x00\x00\x00\x00\x00\x02GQ\x00\x13\x00\x03\x9e\xff\x03'
-                rep = int.from_bytes(res[8:10], 'big') 
-                match rep:
-                    case 0x0001:
-                        # A new tag was added to the observed tag population
-                        reply_reason = 'New Tag Seen'
-                    case 0x0002:
-                        # A tag has not been seen for the configured tag timeout value
-                        reply_reason = 'Tag Removed'
-                    case 0x0003:
-                        # The tag’s reported RSSI value has changed significantly since its last report.
-                        reply_reason = 'Power Changed'
-                    case 0x0004:
-                        # A requested GEN2 operation for this tag has completed
-                        reply_reason = 'GEN2 Op Completed'
-                    case 0x0005:
-                        # If configured, a tag will be periodically reported upon at a specified interval.
-                        reply_reason = 'Tag Report Timeout'
-                    case 0x0006:
-                        # The host requested that one or more tags be reported upon.
-                        reply_reason = 'Report Requested'
-                    case _:
-                        # Should never hit this line
-                        reply_reason = 'Not defined'
-                
-                power_rssi_raw = int.from_bytes(res[10:12], byteorder='big', signed=True)
-                power_dbm = int.from_bytes(res[12:14], byteorder='big', signed=True)
-                timestamp = int.from_bytes(res[14:18], 'big')
-                antenna = int.from_bytes(res[18:20], 'big')
-                epc_length = int.from_bytes(res[20:len(res)], 'big')
+            # parse response (res)
+            tag_report = _parse_tag_report(res)
                 
-                tag_report = {
-                    "replyReason": reply_reason,
-                    "powerRSSIRaw": power_rssi_raw,
-                    "powerdBm": power_dbm,
-                    "timestamp": timestamp,
-                    "antenna": antenna,
-                    "epcLength": epc_length              
-                }  
-            else:
+        return error, tag_report
+
+
+    def wait_for_tag_report(self, timeout = TAG_READ_TIMEOUT):
+        """
+            Waits for a tag to be reported, until the timeout expires
+            
+            The port is watched for the whole remaining time after each request, so the reader answers 
+            (or pushes a report) as soon as it has one. A new report is only requested (after a short pause) 
+            if the reader answered with success but without a tag; any other error ends the wait
+        Args:
+            timeout (float): time to wait for a tag in seconds. Defaults to TAG_READ_TIMEOUT
+        Returns:
+            tuple: 
+                error (str): any error occurred during the process
+                tag_report (dict): tag report (None if no tag was reported in time)
+        """
+        log.debug("Waiting for a tag report...")
+        cr_opcode = _COMMANDS['GET_TAG_REPORT'][0]
+        error = None
+        tag_report = None
+        deadline = monotonic() + timeout
+        while True:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                error = "No tag reported within {} s".format(timeout)
+                log.error(error)
+                break
+            # Transport errors (no response, port closed, send failure) end the wait
+            error, res = self._cmd('GET_TAG_REPORT', rec_timeout=remaining)
+            if error is not None:
+                break
+            if not _is_success(res, cr_opcode):
                 error = "Unable to get a tag report"
-                print(error, flush=True)                     
-                
+                log.error(error)
+                break
+            if len(res) >= 8 + _TAG_REPORT_STRUCT.size:
+                tag_report = _parse_tag_report(res)
+                break
+            # The reader answered, but has no tag to report (yet)
+            self.msleep(int(min(self.TAG_REPORT_RETRY_INTERVAL_MS, remaining * 1000)))
+        log.debug("tag_report: %s", tag_report)
+        
         return error, tag_report
 
 
@@ -749,37 +843,15 @@ class UHFReaderThread(QThread):
         """
             Gets the status of all four antennas (enabled or disabled)
         """
-        print("Getting antenna enables...", flush=True)
-        length = '0004'
-        cr_opcode = '000F'   
-        msg = self.build_cmd(length=length, cr_opcode=cr_opcode)
-        
-        res = None
-        error = None
-        error = self.send_cmd(msg)
-        if error is None:
-            wait_ms(500)
-            error, res = self.wait_for_response_short(self.UHFBytes.GET_ANT_ENABLES)
+        log.debug("Getting antenna enables...")
+        error, res = self._cmd('GET_ANT_ENABLES', error_msg="Unable to get antenna enables!", min_len=8 + _ANT_ENABLES_STRUCT.size)
 
         ant_enables = None    
         if error is None:
-            if res[6:8] == self.UHFBytes.STATUS_SUCCESS and res[4:6] == self.UHFBytes.GET_ANT_ENABLES:
-                # parse response (res)
-                # example res: 
-                bit_vector = int.from_bytes(res[8:len(res)], 'big')                
-                ant_1_enables = self.bit_status(bit_vector,0)
-                ant_2_enables = self.bit_status(bit_vector,1)
-                ant_3_enables = self.bit_status(bit_vector,2)
-                ant_4_enables = self.bit_status(bit_vector,3)
-                ant_enables = {
-                    "ant1enables": ant_1_enables,
-                    "ant2enables": ant_2_enables,
-                    "ant3enables": ant_3_enables,
-                    "ant4enables": ant_4_enables
-                }
-            else:
-                error = "Unable to get antenna enables!"
-                print(error, flush=True)
+            # parse response (res)
+            # example res: 
+            bit_vector = _ANT_ENABLES_STRUCT.unpack_from(res, 8)[0]                
+            ant_enables = dict(zip(_ANT_ENABLES_BITS, (bool((bit_vector >> i) & 1) for i in range(len(_ANT_ENABLES_BITS)))))
                 
         return error, ant_enables
     
@@ -788,27 +860,10 @@ class UHFReaderThread(QThread):
         """
             Enables/disables all four antennas 
         """
-        print("Setting antenna enables...", flush=True)
-        length = '0006'
-        cr_opcode = '000E'   
-        ant_enables = int('0000{}{}{}{}'.format(ant4Enables, ant3Enables, ant2Enables, ant1Enables), 2) 
-        msg = self.build_cmd(length, cr_opcode, word1=ant_enables, word_type='int')
-        
-        res = None
-        error = None
-        error = self.send_cmd(msg)
-        if error is None:
-            wait_ms(1000)
-            error, res = self.wait_for_response_short(self.UHFBytes.SET_ANT_ENABLES)
-            if res == b'':
-                error, res = self.wait_for_response_long(self.UHFBytes.SET_ANT_ENABLES)
-               
-        if error is None:
-            # parse response (res)
-            # example: b'\xf6(\x00\x06\x80\x0e\x00\x00'
-            if not res[6:8] == self.UHFBytes.STATUS_SUCCESS and res[4:6] == self.UHFBytes.SET_ANT_ENABLES:
-                error = "Unable to set antenna enables!"
-                print(error, flush=True)
+        log.debug("Setting antenna enables...")
+        ant_enables = (int(ant4Enables) << 3) | (int(ant3Enables) << 2) | (int(ant2Enables) << 1) | int(ant1Enables)
+        # example res: b'\xf6(\x00\x06\x80\x0e\x00\x00'
+        error, res = self._cmd('SET_ANT_ENABLES', ant_enables, error_msg="Unable to set antenna enables!", rec_timeout=self.SET_REC_TIMEOUT)
                 
         return error    
 
@@ -816,26 +871,12 @@ class UHFReaderThread(QThread):
     def set_op_state(self, op_state):
         """
             Sets operating state
+        Args:
+            op_state (int): operating state (e.g. UHFOperatingState.TAG_READ)
         """
-        print("Setting operating state...", flush=True)
-        length = '0006'
-        cr_opcode = '000C'   
-        msg = self.build_cmd(length, cr_opcode, word1=op_state, word_type='byt')
-        
-        res = None
-        error = None
-        error = self.send_cmd(msg)
-        if error is None:
-            wait_ms(1000)
-            error, res = self.wait_for_response_short(self.UHFBytes.SET_OP_STATE)
-            if res == b'':
-                error, res = self.wait_for_response_long(self.UHFBytes.SET_OP_STATE)
-               
-        if error is None:
-            # parse response (res)
-            if not res[6:8] == self.UHFBytes.STATUS_SUCCESS and res[4:6] == self.UHFBytes.SET_OP_STATE:
-                error = "Unable to set operating state to '{}'".format(op_state)
-                print(error, flush=True)
+        log.debug("Setting operating state...")
+        error_msg = "Unable to set operating state to '{}'".format(_OP_STATE_NAMES.get(op_state, op_state))
+        error, res = self._cmd('SET_OP_STATE', op_state, error_msg=error_msg, rec_timeout=self.SET_REC_TIMEOUT)
                 
         return error   
     
@@ -844,51 +885,15 @@ class UHFReaderThread(QThread):
         """
             Gets operating state
         """
-        print("Getting operating state...", flush=True)
-        length = '0004'
-        cr_opcode = '000D'         
-        msg = self.build_cmd(length=length, cr_opcode=cr_opcode)
-        
-        res = None
-        error = None
-        error = self.send_cmd(msg)
-        if error is None:
-            wait_ms(500)
-            error, res = self.wait_for_response_short(self.UHFBytes.GET_OP_STATE)
-            # error, res = self.wait_for_response_long(self.UHFBytes.GET_OP_STATE)
+        log.debug("Getting operating state...")
+        error, res = self._cmd('GET_OP_STATE', error_msg="Unable to get operating state", min_len=10 + _OP_STATE_STRUCT.size)
         
         op_state = None    
         if error is None:
-            if res[6:8] == self.UHFBytes.STATUS_SUCCESS and res[4:6] == self.UHFBytes.GET_OP_STATE:
-                # parse response (res)
-                # example res: b'\xf6(\x00\n\x80\r\x00\x00\x00\x00\x00\x00'
-                rep = int.from_bytes(res[10:12], 'big') 
-                match rep:
-                    case 0x0000: 
-                        op_state = 'Idle'
-                    case 0x0001:
-                        op_state = 'CW Test'
-                    case 0x0002:
-                        op_state = 'PRBS Test'
-                    case 0x0003:
-                        op_state = 'ETSI Burst Test'
-                    case 0x0004:
-                        op_state = 'Tag Read'
-                    case 0x0005:
-                        op_state = 'Over Temp'
-                    case 0x0006:
-                        op_state = 'Reader_Error'
-                    case 0x0007:
-                        op_state = 'Hard_Reset'
-                    case 0x0008:
-                        op_state = 'SW_Mismatch'
-                    case 0x0009:
-                        op_state = 'Bootloader'  
-                    case _:
-                        op_state = 'Not defined'
-            else:
-                error = "Unable to get operating state"
-                print(error, flush=True)
+            # parse response (res)
+            # example res: b'\xf6(\x00\n\x80\r\x00\x00\x00\x00\x00\x00'
+            rep = _OP_STATE_STRUCT.unpack_from(res, 10)[0]
+            op_state = _OP_STATE_NAMES.get(rep, 'Not defined')
                 
         return error, op_state
     
@@ -897,34 +902,32 @@ class UHFReaderThread(QThread):
         """
             Sends 'Keep-Alive' message to the reader
         """
-        # print("Keeping UHF reader alive...", flush=True) 
-        length = '0004'
-        cr_opcode = '0001' 
-        msg = self.build_cmd(length=length, cr_opcode=cr_opcode)
+        # log.debug("Keeping UHF reader alive...") 
 
-        # Loop until the UHF reader is awake and we get a response from it!
+        # Loop until the UHF reader is awake and we get a response from it (backing off exponentially)!
         count = 0
         res = None
         error = None
-        while count < 15:
+        retry_interval_ms = self.KEEP_ALIVE_RETRY_INTERVAL_MS
+        while count < self.KEEP_ALIVE_MAX_RETRIES:
             count += 1
-            # print("count: {}".format(count), flush=True)
-            error = self.send_cmd(msg)
-            if error is None:
-                error, res = self.wait_for_response_short(self.REC_TIMEOUT)
-                if not (res is None) and (res != b''):
-                    break
-            wait_ms(1000)        
-        # print("res: {}".format(res), flush=True)
+            # log.debug("count: %s", count)
+            error, res = self._cmd('KEEP_ALIVE')
+            if not (res is None) and (res != b''):
+                break
+            if count < self.KEEP_ALIVE_MAX_RETRIES:
+                self.msleep(retry_interval_ms)
+                retry_interval_ms *= 2
+        # log.debug("res: %s", res)
             
         alive = None
         if error is None:
             # parse response (res)
-            if res[6:8] == self.UHFBytes.STATUS_SUCCESS and res[4:6] == self.UHFBytes.KEEP_ALIVE:
+            if _is_success(res, _COMMANDS['KEEP_ALIVE'][0]):
                 alive = True
             else:
                 error = "Unable to keep UHF module alive"
-                print(error, flush=True)
+                log.error(error)
                 
         return error, alive
     
@@ -935,148 +938,99 @@ class UHFReaderThread(QThread):
             to the reader, until it receives an order to get a report. It then sets and gets a number of
             parameters and sends them back to the server.
         """
-        # Open the serial port for communication
-        err = self.ser.serial_open()
+        # Open the serial port (in this thread, so the retries never block the GUI), unless it is open already
+        err = None
+        if not self.ser.com.is_open:
+            err = self.open_serial_port()
         if err is None:
             while True:       
-                alive = None
-                errorAll = None
-                version = None
-                temp = None
-                op_reg = None
-                tx_power = None
-                ant_enables = None
-                op_state = None
-                tag_report = None
-                tag_report_timeout = None
-                event_mask = None
-                
-                error_keep_alive = None
-                error_op_region_set = None
-                error_set_tx_power = None
-                error_set_ant_enables = None
-                error_version_get = None
-                error_temp_get = None
-                error_op_reg_get = None
-                error_tx_power_get = None
-                error_get_ant_enables = None
-                error_tag_report_get = None
-                error_set_op_state = None
-                error_op_state_get = None
-                error_get_op_params = None
-                error_set_op_params = None
-                error_get_event_mask = None
-                error_set_event_mask = None
-
-                # Loops with 'Keep Alive' until the UHF reader receives a command from client to start reading
-                startReading = False
-                params = {}
-                while not startReading:
-                    params, startReading = self.get_uhf_params()
+                # Sleeps until the UHF reader receives a command from client to start reading, with a 'Keep Alive' 
+                # every KEEP_ALIVE_INTERVAL_S in the meantime
+                while not self.start_reading_event.wait(self.KEEP_ALIVE_INTERVAL_S):
+                    self.keep_alive()
+                    self.reopen_serial_port_on_link_error()
+                params, startReading = self.take_uhf_params()
+                if not startReading:
+                    continue
+                # Make sure the UHF reader is awake before the round starts, reconnecting if the link was lost
+                error_keep_alive, alive = self.keep_alive()
+                if error_keep_alive is not None and self.reopen_serial_port_on_link_error():
                     error_keep_alive, alive = self.keep_alive()
-                    wait_ms(1000)
-                self.set_uhf_params(False, {})
+                
+                # Aggregate error messages and all reads, only for the calls that actually ran
+                errorAll = {"keep_alive": error_keep_alive}
+                meta_data = {"error": errorAll, "alive": alive}
                 
                 if error_keep_alive is None:
                     ## Get parameters
-                    tagReport = params["tagReport"]
-                    soundEffect = params["soundEffect"]
-                    opRegion = params["opRegion"]
-                    ant1TxPower = params["ant1TxPower"]
-                    ant2TxPower = params["ant2TxPower"]
-                    ant3TxPower = params["ant3TxPower"]
-                    ant4TxPower = params["ant4TxPower"]
-                    ant1Enables = params["ant1Enables"]
-                    ant2Enables = params["ant2Enables"]
-                    ant3Enables = params["ant3Enables"]
-                    ant4Enables = params["ant4Enables"]
-                    print("[{}] UHF reader params: {}".format(get_fun_name(), params), flush=True)
+                    uhf_params = UHFParams.from_dict(params)
+                    log.debug("[start_reading] UHF reader params: %s", uhf_params)
                     
                     ## Sets
-                    error_set_op_state = self.set_op_state(self.UHFOperatingState.IDLE) # Set operating state to idle to avoid interference
-                    error_op_region_set = self.set_op_region(opRegion) 
-                    error_set_tx_power = self.set_tx_power(ant1TxPower, ant2TxPower, ant3TxPower, ant4TxPower)
-                    error_set_ant_enables = self.set_ant_enables(ant1Enables, ant2Enables, ant3Enables, ant4Enables)
+                    errorAll["opSate_set"] = self.set_op_state(self.UHFOperatingState.IDLE) # Set operating state to idle to avoid interference
+                    error_op_region_set = errorAll["opRegion_set"] = self.set_op_region(uhf_params.opRegion) 
+                    errorAll["SET_TX_POWER"] = self.set_tx_power(uhf_params.ant1TxPower, uhf_params.ant2TxPower, 
+                                                                 uhf_params.ant3TxPower, uhf_params.ant4TxPower)
+                    errorAll["SET_ANT_ENABLES"] = self.set_ant_enables(uhf_params.ant1Enables, uhf_params.ant2Enables, 
+                                                                       uhf_params.ant3Enables, uhf_params.ant4Enables)
                     # New params
-                    # error_set_op_params = self.set_operational_param(self.OPParams.TAG_REPORT_TIMEOUT_CODE, 50000)
-                    # error_set_event_mask = self.set_event_mask(1, 1, 1, 1, 1, 1)                
+                    # errorAll["op_params_set"] = self.set_operational_param(self.OPParams.TAG_REPORT_TIMEOUT_CODE, 50000)
+                    # errorAll["event_mask_set"] = self.set_event_mask(1, 1, 1, 1, 1, 1)                
                     
                     ## Gets
                     # Now that the UHF reader is awake, get other information from it
-                    error_version_get, version = self.get_version()        
-                    error_temp_get, temp = self.get_temp()
-                    error_op_reg_get, op_reg = self.get_op_region()
-                    error_tx_power_get, tx_power = self.get_tx_power()
-                    error_get_ant_enables, ant_enables = self.get_ant_enables()
+                    if 'version' not in self._static:
+                        errorAll["version_get"], version = self.get_version()        
+                        if version is not None:
+                            self._static['version'] = version
+                    meta_data["version"] = self._static.get('version')
+                    errorAll["temp_get"], meta_data["temp"] = self.get_temp()
+                    if error_op_region_set is None and uhf_params.opRegion != self._last_op_region_set:
+                        # A different operating region was set, so the cached one is stale
+                        self._last_op_region_set = uhf_params.opRegion
+                        self._op_region_cached = None
+                    if self._op_region_cached is None:
+                        errorAll["op_reg_get"], self._op_region_cached = self.get_op_region()
+                    meta_data["op_reg"] = self._op_region_cached
+                    errorAll["tx_power_get"], meta_data["tx_power"] = self.get_tx_power()
+                    errorAll["GET_ANT_ENABLES"], meta_data["ant_enables"] = self.get_ant_enables()
                     # New params
-                    # error_get_op_params, tag_report_timeout = self.get_operational_params(self.OPParams.TAG_REPORT_TIMEOUT_CODE)
-                    # error_get_event_mask, event_mask = self.get_event_mask()
+                    # errorAll["op_params_get"], meta_data["tag_report_timeout"] = self.get_operational_params(self.OPParams.TAG_REPORT_TIMEOUT_CODE)
+                    # errorAll["event_mask_get"], meta_data["event_mask"] = self.get_event_mask()
 
                     # Keep alive
-                    error_keep_alive, alive = self.keep_alive()
-                    error_keep_alive, alive = self.keep_alive()
+                    self.keep_alive()
+                    errorAll["keep_alive"], meta_data["alive"] = self.keep_alive()
                     
                     ## Read tags in the range
-                    if tagReport:
-                        error_set_op_state = self.set_op_state(self.UHFOperatingState.TAG_READ) # Must be set for tag read!
-                        error_op_state_get, op_state = self.get_op_state() 
+                    if uhf_params.tagReport:
+                        self.set_op_state(self.UHFOperatingState.TAG_READ) # Must be set for tag read!
+                        errorAll["op_state_get"], meta_data["op_state"] = self.get_op_state() 
                                                
-                        i = 0
-                        while i < 10:
-                            i += 1
-                            error_tag_report_get, tag_report = self.get_tag_report()  
-                            print("tag_report: {}".format(tag_report), flush=True)                     
-                            if tag_report is not None:                            
-                                break
+                        error_tag_report_get, tag_report = self.wait_for_tag_report()
+                        errorAll["tag_report_get"], meta_data["tag_report"] = error_tag_report_get, tag_report
+                        if tag_report is not None and self.on_tag is not None:
+                            self.on_tag(tag_report)
                         
                         # Set operating state to IDLE as soon as down
-                        error_set_op_state = self.set_op_state(self.UHFOperatingState.IDLE)
+                        errorAll["opSate_set"] = self.set_op_state(self.UHFOperatingState.IDLE)
                         
                         # If soundEffect is enabled
-                        if soundEffect:
+                        if uhf_params.soundEffect:
                             # If a tag was detected, emit a signal to play an audio file
                             if not error_tag_report_get:
                                 self.signal_tag_detected_audio.emit()
-
-                # Aggregate error messages
-                errorAll = {
-                    "keep_alive": error_keep_alive,
-                    "opSate_set": error_set_op_state,
-                    "opRegion_set": error_op_region_set,
-                    "SET_TX_POWER": error_set_tx_power,
-                    "SET_ANT_ENABLES": error_set_ant_enables,
-                    "version_get": error_version_get,
-                    "temp_get": error_temp_get,
-                    "op_reg_get": error_op_reg_get,
-                    "tx_power_get": error_tx_power_get,
-                    "GET_ANT_ENABLES": error_get_ant_enables,
-                    "op_state_get": error_op_state_get,
-                    "tag_report_get": error_tag_report_get
-                }
-                
-                # Aggregate all reads into a dictionary
-                meta_data = {
-                    "error": errorAll,
-                    "alive": alive,
-                    "version": version,
-                    "temp": temp,
-                    "op_reg": op_reg,
-                    "tx_power": tx_power,
-                    "ant_enables": ant_enables,
-                    "op_state": op_state,
-                    "tag_report": tag_report
-                }
                 
                 # Emit the data as a dictionary
                 self.signal_give_uhf_meta_data.emit(True, meta_data)        
-                print("[{}] Give-UHF-data signal emitted...: {}".format(get_fun_name(), err), flush=True)
+                log.debug("[start_reading] Give-UHF-data signal emitted...: %s", err)
  
         else:
             meta_data = {
                 "error": err
             }
             self.signal_give_uhf_meta_data.emit(True, meta_data)        
-            print("[{}] error: {}".format(get_fun_name(), err), flush=True)
+            log.error("[start_reading] error: %s", err)
 
         return err
     
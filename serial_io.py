@@ -1,15 +1,19 @@
 import serial
 import serial.tools.list_ports
-from time                       import time
+from time                       import time, monotonic, sleep
 import math
+import os
+import select
 import sys
 import traceback
 import inspect
+import logging
 from PyQt5.QtCore           import *
-from PyQt5                  import QtTest
 
 __author__ = "Y. Osroosh, Ph.D. <yosroosh@gmail.com>"
 
+log = logging.getLogger(__name__)
+
 def get_fname():
     """
         Provides stack traceback information
@@ -35,19 +39,19 @@ def wait_s(seconds: int):
     """
         Waits for the specified number of seconds as a safe alternative to using sleep()
     """
-    i = 0
-    while i < seconds:
-        i += 1
-        dieTime = QTime.currentTime().addSecs(1)
-        while QTime.currentTime() < dieTime:
-            QCoreApplication.processEvents(QEventLoop.AllEvents, 100)
+    wait_ms(seconds * 1000)
 
 
 def wait_ms(milli_seconds: int):
     """
         Waits for the specified number of milli seconds as a safe alternative to using sleep()
+        
+        Events keep being processed by a local event loop, which a single-shot timer quits, 
+        instead of polling them over and over like QTest.qWait does
     """
-    QtTest.QTest.qWait(milli_seconds)
+    loop = QEventLoop()
+    QTimer.singleShot(milli_seconds, loop.quit)
+    loop.exec_()
 
 
 
@@ -62,6 +66,7 @@ class SerialPort():
         self.stopbits = SerialSettings['stopbits']
         self.bytesize = SerialSettings['bytesize']
         self.time_out = SerialSettings['time_out']
+        self.settle_ms = SerialSettings.get('settle_ms', 50)
         self.com = serial.Serial()
         
 
@@ -69,7 +74,7 @@ class SerialPort():
         """
             Opens serial port
         """      
-        # print("Opening serial port ({port})".format(port = self.serial_port), flush=True)
+        # log.debug("Opening serial port (%s)", self.serial_port)
         
         error = None
         try:
@@ -82,15 +87,17 @@ class SerialPort():
                 bytesize = self.bytesize,
                 timeout = self.time_out
             ) 
-            wait_ms(2000) # give the connection a second or two to settle
+            # Give the connection a moment to settle, then discard whatever arrived while opening it. A plain 
+            # sleep, as wait_ms would spin a nested event loop in whichever thread opens the port
+            sleep(self.settle_ms / 1000)
             self.flush_buffers()
     
             if self.com.is_open:
-                print("Successfully opened serial port {}".format(self.serial_port), flush=True)                          
+                log.info("Successfully opened serial port %s", self.serial_port)                          
         
         except Exception as e1:
             error = "[{}] {}".format(get_fname(), str(e1))
-            print("Error: {}".format(error), flush=True)
+            log.error("Error: %s", error)
         
         return error
     
@@ -99,18 +106,63 @@ class SerialPort():
         """
             Closes serial port
         """      
-        # print("Closing serial port ({port})".format(port = self.serial_port), flush=True)
+        # log.debug("Closing serial port (%s)", self.serial_port)
         
         error = None
         try:
             if self.com.is_open:
                 # close the serial port
                 self.com.close()
-                # print("Successfully closed the port...", flush=True)                          
+                # log.debug("Successfully closed the port...")                          
         
         except Exception as e1:
             error = "[{}] {}".format(get_fname(), str(e1))
-            print("Error: {}".format(error), flush=True)
+            log.error("Error: %s", error)
+        
+        return error
+    
+    
+    def fileno(self):
+        """
+            Returns the file descriptor of the open serial port (POSIX only)
+        """
+        return self.com.fileno()
+
+
+    def set_low_latency(self):
+        """
+            Puts the (USB-)serial port into low latency mode, so received bytes are handed over
+            immediately instead of after the FTDI latency timer expires (16 ms by default)
+            
+            On Linux, pyserial sets ASYNC_LOW_LATENCY using TIOCGSERIAL/TIOCSSERIAL. USB-serial 
+            adapters also expose the latency timer through sysfs, which is set to 1 ms as a fallback.
+            The pyserial Windows backend already configures COMMTIMEOUTS, so nothing is done there.
+        Returns:
+            str: error (if any)
+        """
+        error = None
+        low_latency = False
+        try:
+            if self.com.is_open and hasattr(self.com, 'set_low_latency_mode'):
+                self.com.set_low_latency_mode(True)
+                low_latency = True
+        except Exception as e1:
+            error = "[{}] {}".format(get_fname(), str(e1))
+        
+        # Fall back to the sysfs latency timer (e.g. /sys/bus/usb-serial/devices/ttyUSB0/latency_timer)
+        tty = os.path.basename(os.path.realpath(self.serial_port))
+        latency_timer = "/sys/bus/usb-serial/devices/{}/latency_timer".format(tty)
+        if not low_latency and os.path.exists(latency_timer):
+            try:
+                with open(latency_timer, 'w') as f:
+                    f.write('1')
+                error = None
+            except Exception as e1:
+                error = "[{}] {}".format(get_fname(), str(e1))
+        
+        # Not fatal, the port still works, just with the default latency
+        if error is not None:
+            log.warning("Unable to set low latency mode: %s", error)
         
         return error
     
@@ -124,20 +176,18 @@ class SerialPort():
         """
             Writes data to a serial port
         """      
-        # print("Writing data to serial port ({port}):".format(port = self.serial_port), flush=True)
+        # log.debug("Writing data to serial port (%s):", self.serial_port)
         
         error = None
         try:
             if self.com.is_open:      
-                self.flush_buffers() 
-                      
                 # Write to the serial port 
-                # print("{}".format(cmd), flush=True)                             
+                # log.debug("%s", cmd)                             
                 self.com.write(cmd)   
 
         except Exception as e1:
             error = "[{}] {}".format(get_fname(), str(e1))
-            print("Error: {}".format(error), flush=True)
+            log.error("Error: %s", error)
 
         return error  
         
@@ -150,41 +200,130 @@ class SerialPort():
         Returns:
             tuple: error (if any) and data in (if any) are returned
         """
-        # print("Receiving data from serial port ({port}):".format(port = self.serial_port), flush=True)        
+        # log.debug("Receiving data from serial port (%s):", self.serial_port)        
+        # Sleep in the kernel (select) until the port becomes readable or the timeout expires, then read
+        # whatever is buffered (FIONREAD) in one go
+        error, data_in = self.serial_read_available(rec_timeout)
+        
+        if error is None and not data_in:
+            error = "Err1: No bytes from the device"
+            # log.debug(error)  
+        
+        return error, data_in
+    
+    
+    def serial_read_available(self, rec_timeout: float):
+        """
+            Waits until the serial port becomes readable (select) and reads all bytes available
+        Args:
+            rec_timeout (float): This is the maximum time the method will wait for serial data in seconds
+        Returns:
+            tuple: error (if any) and data in (empty if nothing arrived before the timeout) are returned
+        """
+        error = None
+        data_in = b""
+        try:
+            if self.com.is_open:
+                deadline = monotonic() + max(rec_timeout, 0)
+                # Take whatever is buffered already, or sleep in select until the first byte arrives (the same 
+                # FIONREAD/select read as for response frames, see read_exact)
+                buf = bytearray(self.read_exact(max(self.com.in_waiting, 1), deadline))
+                # Keep draining bytes that came in meanwhile (e.g. a burst of frames) into one growing buffer, but 
+                # no longer than rec_timeout, so a device that never stops sending cannot keep us here
+                bytes_waiting = self.com.in_waiting
+                while bytes_waiting and monotonic() < deadline:
+                    buf += self.com.read(bytes_waiting)
+                    bytes_waiting = self.com.in_waiting
+                data_in = bytes(buf)
+            else:
+                error = "Err2: Cannot open serial port." 
+                log.error(error)
+        
+        except Exception as e1:
+            error = "[{}] {}".format(get_fname(), str(e1))
+            log.error("Error: %s", error)
+        
+        return error, data_in
+    
+    
+    def read_exact(self, size: int, deadline: float):
+        """
+            Reads exactly size bytes, or fewer if the deadline passes first
+            
+            The port is watched with select and only the bytes already buffered (FIONREAD) are read, so the 
+            reads never block and the port timeout never has to be reconfigured
+        Args:
+            size (int): number of bytes to read
+            deadline (float): time (time.monotonic) until which to wait for the bytes
+        Returns:
+            bytes: bytes read
+        """
+        data_in = bytearray()
+        while len(data_in) < size:
+            bytes_waiting = self.com.in_waiting
+            if bytes_waiting == 0:
+                remaining = deadline - monotonic()
+                if remaining <= 0 or not select.select([self.fileno()], [], [], remaining)[0]:
+                    break
+                bytes_waiting = max(self.com.in_waiting, 1)
+            data_in += self.com.read(min(bytes_waiting, size - len(data_in)))
+        
+        return bytes(data_in)
+    
+    
+    def serial_receive_frame(self, framing: bytes, set_response: bytes, rec_timeout: float = 5.000):
+        """
+            Reads one complete frame of the expected response with exact-length reads
+            
+            A frame starts with the framing bytes, followed by 2 length bytes (the length includes them, but not the 
+            framing bytes) and the rest of the message, starting with the response code. So the port is read up to 
+            the framing bytes, then the length and then exactly the rest of the frame (see read_exact). Frames of 
+            other responses (e.g. 'keep alive') are skipped
+        Args:
+            framing (bytes): framing bytes every frame starts with
+            set_response (bytes): response code (first bytes after the length) of the expected frame
+            rec_timeout (float, optional): This is the maximum time the method will wait for the frame. Defaults to ~5 second.
+        Returns:
+            tuple: error (if any) and the frame are returned. If the expected frame did not arrive in time, the last 
+                   frame read (if any) is returned instead
+        """
         error = None
-        data_in = None
+        frame = b""
         try:
-            if self.com.is_open:         
-                # Read from the serial port	
-                data_in = b""                
-                count = 0
-                while count < (rec_timeout * 1000):
-                    count += 1
-                    ## bytesWaiting = self.com.inWaiting()
-                    bytesWaiting = self.com.in_waiting
-                    if(bytesWaiting != 0):
-                        byte_in = self.com.read(bytesWaiting)
-                        if byte_in:
-                            data_in += byte_in   
+            if self.com.is_open:
+                deadline = monotonic() + rec_timeout
+                while monotonic() < deadline:
+                    # Slide over the input until the framing bytes show up
+                    window = self.read_exact(len(framing), deadline)
+                    while len(window) == len(framing) and window != framing:
+                        byte_in = self.read_exact(1, deadline)
+                        if not byte_in:
                             break
-                    wait_ms(1) 
+                        window = window[1:] + byte_in
+                    if window != framing:
+                        break
+                    length = self.read_exact(2, deadline)
+                    body_len = max(int.from_bytes(length, 'big') - 2, 0)
+                    body = self.read_exact(body_len, deadline) if len(length) == 2 else b""
+                    frame = framing + length + body
+                    if len(length) < 2 or len(body) < body_len:
+                        error = "Err3: Incomplete frame"
+                        log.error(error)
+                        break
+                    if body.startswith(set_response):
+                        break
                 
-                if data_in:
-                    # print("{}".format(data_in), flush=True)
-                    pass
-                else:
+                if error is None and not frame:
                     error = "Err1: No bytes from the device"
-                    # print(error, flush=True)  
-                    pass                      
             else:
                 error = "Err2: Cannot open serial port." 
-                print(error, flush=True)                                 
+                log.error(error)
         
         except Exception as e1:
             error = "[{}] {}".format(get_fname(), str(e1))
-            print("Error: {}".format(error), flush=True)
+            log.error("Error: %s", error)
         
-        return error, data_in
+        return error, frame
         
     
 
@@ -195,7 +334,8 @@ UHFReaderSerialSettings15 = {
     "parity": 'N',
     "stopbits": 1,
     "bytesize": 8,
-    "time_out": 0.1
+    "time_out": 0.1,
+    "settle_ms": 50     # Time in ms the connection is given to settle after opening the port
 }
 # Instantiate some object
 uhf_ser = SerialPort(UHFReaderSerialSettings15)